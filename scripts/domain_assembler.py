@@ -1,12 +1,27 @@
 # scripts/convert_gazebo_to_domain.py
 """
-Convert Gazebo world JSON to domain.yaml.
+Convert Gazebo world JSON to domain.yaml (or domain.json / domain.py).
 For now, uses hardcoded test data (no Gazebo JSON input yet).
 """
 
+import json
+import math
+import os
+import pickle
+import pprint
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as CSafeDumper
+
+# Built once; register any custom representers on CSafeDumper here, at import.
+# sort_keys=False keeps generate_test_domain's authored order (metadata first,
+# derived _indexes last); sort_keys=True measured no faster with CSafeDumper.
+_YAML_DUMP_KWARGS = dict(Dumper=CSafeDumper, default_flow_style=False, sort_keys=False)
+
 def generate_test_domain():
     """
     Generate test domain config.
@@ -71,17 +86,134 @@ def generate_test_domain():
         ]
     }
 
-def convert_gazebo_to_domain(gazebo_json_path=None, output_path='configs/domain.yaml'):
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Entity lists that get an id -> position index under domain['_indexes']
+INDEXED_LISTS = ('zones', 'shelves', 'tables', 'doors', 'items')
+
+
+def build_indexes(domain):
+    """
+    Derived lookup tables, {'<list>_by_id': {entity_id: position in list}}.
+    The leading underscore on '_indexes' marks it as derived: do not hand-edit.
+    Positions (not the entity dicts) are stored so YAML output has no aliases.
+    """
+    return {
+        f'{name}_by_id': {entity['id']: i for i, entity in enumerate(domain[name])}
+        for name in INDEXED_LISTS if name in domain
+    }
+
+
+def _is_block(value):
+    """Non-empty dicts and lists of dicts go block style; everything else inline."""
+    if isinstance(value, dict):
+        return bool(value)
+    return isinstance(value, list) and any(isinstance(v, dict) for v in value)
+
+
+def _yaml_float(value):
+    """Float literal that YAML 1.1 (PyYAML) reads back as a float."""
+    if not math.isfinite(value):
+        raise ValueError(f"cannot write non-finite float {value!r} to domain YAML")
+    text = repr(value)
+    mantissa, e, exponent = text.partition('e')
+    if '.' not in mantissa:
+        # YAML 1.1 floats need a '.' in the mantissa ("1e-05" would load as a string)
+        text = f"{mantissa}.0{e}{exponent}"
+    return text
+
+
+def _yaml_flow(value):
+    """Inline (flow style) YAML for scalars, lists and dicts."""
+    if isinstance(value, bool) or value is None:
+        return json.dumps(value)
+    if isinstance(value, float):
+        return _yaml_float(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str):
+        # Double-quoted JSON strings are valid YAML and never re-typed ("1", "yes")
+        return json.dumps(value)
+    if isinstance(value, dict):
+        return '{' + ', '.join(f"{_yaml_flow(k)}: {_yaml_flow(v)}" for k, v in value.items()) + '}'
+    return '[' + ', '.join(_yaml_flow(v) for v in value) + ']'
+
+
+def _write_yaml_mapping(mapping, f, indent, first_prefix):
+    pad = '  ' * indent
+    prefix = first_prefix
+    for key, value in mapping.items():
+        if _is_block(value):
+            f.write(f"{prefix}{_yaml_flow(key)}:\n")
+            _write_yaml_node(value, f, indent + 1)
+        else:
+            f.write(f"{prefix}{_yaml_flow(key)}: {_yaml_flow(value)}\n")
+        prefix = pad
+
+
+def _write_yaml_node(node, f, indent):
+    pad = '  ' * indent
+    if isinstance(node, dict):
+        _write_yaml_mapping(node, f, indent, pad)
+        return
+    for item in node:
+        if isinstance(item, dict) and item:
+            # First key shares the "- " line, remaining keys align under it
+            _write_yaml_mapping(item, f, indent + 1, f"{pad}- ")
+        else:
+            f.write(f"{pad}- {_yaml_flow(item)}\n")
+
+
+def write_domain_yaml(domain, f):
+    """
+    Write a domain dict as block-style YAML without going through PyYAML.
+    
+    Only covers what generate_test_domain produces: nested dicts, lists of
+    dicts, and flat lists of scalars (written inline, e.g. position: [100, 100]).
+    Keys and strings are double-quoted; non-finite floats raise ValueError.
+    No anchors/aliases and no representer dispatch.
+    """
+    _write_yaml_node(domain, f, 0)
+
+
+def write_domain_py(domain, f):
+    """
+    Write the domain as a Python module defining DOMAIN = {...}.
+    Importing it (from configs.domain import DOMAIN) needs no parsing beyond
+    the bytecode cache.
+    """
+    f.write("# Generated by scripts/domain_assembler.py - do not edit by hand.\n\n")
+    f.write(f"DOMAIN = {pprint.pformat(domain, sort_dicts=False)}\n")
+
+
+# Output format -> file suffix
+EMIT_SUFFIXES = {'yaml': '.yaml', 'json': '.json', 'py': '.py'}
+
+
+def emit_for_path(path):
+    """Output format implied by a path's suffix (anything but .json/.py is YAML)."""
+    return {'.json': 'json', '.py': 'py'}.get(Path(path).suffix, 'yaml')
+
+
+def convert_gazebo_to_domain(gazebo_json_path=None, output_path='configs/domain.yaml',
+                             fast_yaml=False, emit=None):
     """
     Convert Gazebo world JSON to domain.yaml.
     
     Args:
         gazebo_json_path: Path to Gazebo JSON export (None = use test data)
         output_path: Where to write domain.yaml
+        fast_yaml: Use write_domain_yaml instead of yaml.dump
+        emit: 'yaml', 'json' or 'py' (None = from output_path suffix, default yaml)
     """
     
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not isinstance(output_path, Path):
+        output_path = Path(output_path)
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if emit is None:
+        emit = emit_for_path(output_path)
     
     if gazebo_json_path is None:
         print("No Gazebo JSON provided - generating test data")
@@ -91,11 +223,32 @@ def convert_gazebo_to_domain(gazebo_json_path=None, output_path='configs/domain.
         # TODO: Implement actual Gazebo parsing
         raise NotImplementedError("Gazebo JSON parsing not yet implemented")
     
-    # Write domain.yaml
-    with open(output_path, 'w') as f:
-        yaml.dump(domain, f, default_flow_style=False, sort_keys=False)
+    domain['_indexes'] = build_indexes(domain)
     
-    print(f"Generated domain config at {output_path}")
+    # Write domain.yaml / .json / .py; the emitters write many small chunks, so
+    # buffer generously and let closing the file flush once
+    with open(output_path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+        if emit == 'py':
+            write_domain_py(domain, f)
+        elif emit == 'json':
+            json.dump(domain, f, indent=2)
+        elif fast_yaml:
+            write_domain_yaml(domain, f)
+        else:
+            yaml.dump(domain, f, **_YAML_DUMP_KWARGS)
+    
+    if emit == 'py':
+        # Imported directly; no parse step to cache
+        print(f"Generated domain config at {output_path}")
+    else:
+        # Binary cache for loaders (shared/domain.py), tagged with the source's
+        # (mtime_ns, size) so a later edit of the source is detected exactly
+        source_stat = output_path.stat()
+        cache_path = output_path.with_name(output_path.name + '.pkl')
+        with open(cache_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            pickle.dump((source_stat.st_mtime_ns, source_stat.st_size, domain), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"Generated domain config at {output_path} (cache: {cache_path})")
     
     # Summary
     print(f"\nDomain Summary:")
@@ -111,14 +264,27 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate domain.yaml configuration')
     parser.add_argument('--input', type=str, default=None,
                        help='Path to Gazebo JSON export (omit for test data)')
-    parser.add_argument('--output', type=str, default='configs/domain.yaml',
-                       help='Output path (default: configs/domain.yaml)')
+    parser.add_argument('--output', type=str, default=None,
+                       help='Output path, .yaml/.json/.py (default: configs/domain.<emit suffix>)')
+    parser.add_argument('--emit', choices=sorted(EMIT_SUFFIXES), default=None,
+                       help='Output format (default: from --output suffix, else yaml)')
+    parser.add_argument('--fast-yaml', action='store_true',
+                       help='Use the built-in minimal YAML writer instead of PyYAML')
     
     args = parser.parse_args()
+    if args.output is None:
+        args.output = 'configs/domain' + EMIT_SUFFIXES[args.emit or 'yaml']
+    elif args.emit is not None and emit_for_path(args.output) != args.emit:
+        parser.error(f"--output {args.output} does not match --emit {args.emit} "
+                     f"(expected a {EMIT_SUFFIXES[args.emit]} file)")
+    if args.fast_yaml and (args.emit or emit_for_path(args.output)) != 'yaml':
+        parser.error("--fast-yaml only applies to YAML output")
     
     convert_gazebo_to_domain(
             gazebo_json_path=args.input,
-            output_path=args.output
+            output_path=args.output,
+            fast_yaml=args.fast_yaml,
+            emit=args.emit
         )
 
     
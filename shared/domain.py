@@ -0,0 +1,95 @@
+"""
+shared/domain.py
+
+Loading of the domain configuration (zones, shelves, tables, doors, items)
+generated by scripts/domain_assembler.py.
+"""
+
+import functools
+import json
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+
+# Entity lists whose 'id' and reference fields are interned on load
+_ID_FIELDS = ('id', 'zone', 'initial_location')
+_ENTITY_LISTS = ('zones', 'shelves', 'tables', 'doors', 'items')
+
+
+def _intern_ids(domain: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern entity IDs in place so lookups keyed by them hit the identity fast path."""
+    for list_name in _ENTITY_LISTS:
+        for entity in domain.get(list_name, ()):
+            for key in _ID_FIELDS:
+                if isinstance(entity.get(key), str):
+                    entity[key] = sys.intern(entity[key])
+    indexes = domain.get('_indexes')
+    if indexes:
+        for name, index in indexes.items():
+            indexes[name] = {sys.intern(k): v for k, v in index.items()}
+    return domain
+
+
+@functools.lru_cache(maxsize=8)
+def _load_domain_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    path = Path(path_str)
+    cache_path = path.with_name(path.name + '.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_mtime_ns, cached_size, domain = pickle.load(f)
+        # Exact match, not an mtime ordering: coarse filesystem timestamps can
+        # give a hand edit the same mtime as the pickle written just before it
+        if (cached_mtime_ns, cached_size) == (mtime_ns, size):
+            return _intern_ids(domain)
+    except (FileNotFoundError, ValueError, TypeError):  # missing or old-format cache
+        pass
+    
+    with open(path) as f:
+        if path.suffix == '.json':
+            return _intern_ids(json.load(f))
+        return _intern_ids(yaml.load(f, Loader=CSafeLoader))
+
+
+def get_entity(domain: Dict[str, Any], list_name: str, entity_id: str) -> Dict[str, Any]:
+    """
+    Entity dict by id from one of the domain lists, e.g. get_entity(domain, 'shelves', 'shelf_3').
+    Uses the '_indexes' written by domain_assembler.py, scanning the list if
+    there is no index or it is stale (e.g. the list was reordered by hand).
+    """
+    entities = domain[list_name]
+    position = domain.get('_indexes', {}).get(f'{list_name}_by_id', {}).get(entity_id)
+    if position is not None and position < len(entities) and entities[position]['id'] == entity_id:
+        return entities[position]
+    for entity in entities:
+        if entity['id'] == entity_id:
+            return entity
+    raise KeyError(entity_id)
+
+
+def load_domain(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a domain config (.yaml or .json).
+    
+    Prefers the <name>.pkl cache (e.g. domain.yaml.pkl) written next to it by
+    domain_assembler.py, as long as the source's mtime and size still match
+    the ones recorded in the cache. Falls back to parsing the source if the
+    cache is missing or stale.
+    Entity IDs are interned.
+    
+    Results are memoized on (path, mtime), so repeated calls are a stat() plus
+    a cache hit until the file is rewritten. The returned dict is shared
+    between callers: treat it as read-only.
+    """
+    # Resolved so the same file is one cache entry whatever the working directory
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _load_domain_cached(str(path), stat.st_mtime_ns, stat.st_size)
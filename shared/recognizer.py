@@ -0,0 +1,138 @@
+"""
+shared/recognizer.py
+
+Intention recognition: Bayesian belief updates over the intention index
+(shared.types.INTENTION_INDEX).
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; update_beliefs_batch falls back to NumPy
+    njit = None
+
+from shared.types import BeliefState, Observation
+
+
+# P(observation | intention) for every intention, as an array in INTENTION_INDEX order
+Likelihood = Callable[[Observation], np.ndarray]
+
+
+def _prior(belief: BeliefState, width: int) -> np.ndarray:
+    """
+    belief.distribution, zero-padded to width: a belief built before a later
+    register_intentions() gives the new intentions prior 0.
+    """
+    distribution = belief.distribution
+    if len(distribution) < width:
+        distribution = np.pad(distribution, (0, width - len(distribution)))
+    return distribution
+
+
+def bayes_update(belief: BeliefState, obs: Observation, likelihood: Likelihood) -> BeliefState:
+    """
+    Posterior proportional to prior * P(obs | intention), normalised.
+    If the observation has zero likelihood under every intention, the prior is kept.
+    """
+    lik = likelihood(obs)
+    prior = _prior(belief, len(lik))
+    # Likelihoods are often float64 (NumPy's default); keep the float32 contract
+    posterior = np.multiply(prior, lik, dtype=np.float32)
+    total = posterior.sum()
+    if total > 0:
+        posterior /= total
+    else:
+        posterior = prior.astype(np.float32)
+    return BeliefState(
+        timestamp=obs.timestamp,
+        agent_id=belief.agent_id,
+        distribution=posterior,
+        confidence=float(posterior.max()),
+        predicted_next_actions=belief.predicted_next_actions,
+    )
+
+
+def _pending_updates(observations: List[Observation], beliefs: Dict[str, BeliefState]):
+    return [(beliefs[obs.agent_id], obs) for obs in observations if obs.agent_id in beliefs]
+
+
+def update_beliefs(
+    observations: List[Observation],
+    beliefs: Dict[str, BeliefState],
+    likelihood: Likelihood,
+) -> Dict[str, BeliefState]:
+    """
+    Update each agent's belief with its observation (at most one per agent).
+
+    Agents without an observation keep their belief; observations of agents
+    without a belief are ignored. Runs bayes_update agent by agent; for many
+    agents prefer update_beliefs_batch, which does one array pass. (A thread
+    pool is not worth it: per agent the work is a few floats plus the Python
+    likelihood call, all under the GIL.)
+    """
+    updated = dict(beliefs)
+    for belief, obs in _pending_updates(observations, beliefs):
+        updated[belief.agent_id] = bayes_update(belief, obs, likelihood)
+    return updated
+
+
+def _update_kernel_numpy(dist: np.ndarray, likelihood: np.ndarray, prior: np.ndarray) -> None:
+    """
+    dist[a] = prior[a] * likelihood[a], normalised per agent (row).
+    Rows with zero total mass keep the prior, as in bayes_update.
+    """
+    np.multiply(prior, likelihood, out=dist)
+    totals = dist.sum(axis=1)
+    has_mass = totals > 0
+    dist[has_mass] /= totals[has_mass, None]
+    dist[~has_mass] = prior[~has_mass]
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _update_kernel(dist, likelihood, prior):
+        for a in prange(dist.shape[0]):
+            total = 0.0
+            for i in range(dist.shape[1]):
+                dist[a, i] = prior[a, i] * likelihood[a, i]
+                total += dist[a, i]
+            for i in range(dist.shape[1]):
+                dist[a, i] = dist[a, i] / total if total > 0 else prior[a, i]
+else:
+    _update_kernel = _update_kernel_numpy
+
+
+def update_beliefs_batch(
+    observations: List[Observation],
+    beliefs: Dict[str, BeliefState],
+    likelihood: Likelihood,
+) -> Dict[str, BeliefState]:
+    """
+    Same result as update_beliefs, computed in one pass: priors and
+    likelihoods are stacked into (agents x intentions) float32 arrays and
+    updated by _update_kernel (Numba-compiled when numba is installed).
+    Priors shorter than the likelihoods are zero-padded, as in bayes_update.
+    """
+    pending = _pending_updates(observations, beliefs)
+    updated = dict(beliefs)
+    if not pending:
+        return updated
+
+    lik = np.stack([likelihood(obs) for _, obs in pending]).astype(np.float32, copy=False)
+    width = lik.shape[1]
+    prior = np.stack([_prior(belief, width) for belief, _ in pending]).astype(np.float32, copy=False)
+    dist = np.empty_like(prior)
+    _update_kernel(dist, lik, prior)
+
+    for row, (belief, obs) in zip(dist, pending):
+        updated[belief.agent_id] = BeliefState(
+            timestamp=obs.timestamp,
+            agent_id=belief.agent_id,
+            distribution=row,
+            confidence=float(row.max()),
+            predicted_next_actions=belief.predicted_next_actions,
+        )
+    return updated
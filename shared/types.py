@@ -6,32 +6,125 @@ These types define the contract between simulator-agnostic algorithms and
 simulator-specific implementations.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any, Set
-from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Any, Set, Union
+from enum import Enum, IntEnum
+
+import numpy as np
+
+
+# Optional dict fields (metadata, constraints, ...) default to None rather than a
+# fresh dict per instance. Read them through or_empty(); writers create the dict
+# first: `if obj.metadata is None: obj.metadata = {}` (frozen types take it at
+# construction). On frozen types these fields are excluded from eq/hash.
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
+Params = Tuple[Tuple[str, Any], ...]  # hashable, key-sorted form of a parameter dict
+
+
+def or_empty(mapping: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """The mapping itself, or a shared read-only empty mapping if it is None."""
+    return mapping or _EMPTY_DICT
+
+
+def _freeze_params(parameters: Any) -> Params:
+    if isinstance(parameters, dict):
+        return tuple(sorted(parameters.items()))
+    return tuple(parameters)
 
 
 # =============================================================================
 # OBSERVATION TYPES
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpatialContext:
     """Spatial information about an observed action."""
     position: Tuple[float, float]
     orientation: float
     zone: Optional[str] = None
 
+    def __post_init__(self):
+        if self.zone is not None:
+            object.__setattr__(self, 'zone', sys.intern(self.zone))
 
-@dataclass
+
+@dataclass(slots=True)
 class ActionContext:
     """Contextual information about an observed action."""
     target_object: Optional[str] = None
     progress: float = 0.0  # 0.0 to 1.0
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class MicroActionVerb(IntEnum):
+    """Verb of a micro-action label, e.g. MOVE_TO in "move_to_shelf_3"."""
+    OTHER = 0  # unrecognised verb (or full arg table); encoded as arg 0, the label stays a string
+    MOVE_TO = 1
+    PICK = 2
+    PLACE = 3
+    WAIT = 4
+    HANDOVER = 5
+
+
+_VERB_PREFIXES = [(verb, verb.name.lower()) for verb in MicroActionVerb if verb is not MicroActionVerb.OTHER]
+
+# Argument vocabulary: arg code -> string ("shelf_3", "item_7", ...); 0 = no argument.
+# Only arguments of known verbs are registered, and at most 1 << 16 of them (the
+# packed code has 16 bits for arg), so this and the memo below stay bounded.
+MICROACTION_ARGS: List[str] = [""]
+_MICROACTION_ARG_INDEX: Dict[str, int] = {"": 0}
+_MICROACTION_CODES: Dict[str, Tuple[int, int]] = {}  # memo: label -> (verb, arg), known verbs only
+_MAX_MICROACTION_ARGS = 1 << 16
+_OTHER_CODES = (MicroActionVerb.OTHER, 0)
+
 
+def _microaction_arg_code(arg: str) -> Optional[int]:
+    """Code of arg, registering it if there is room; None once the table is full."""
+    code = _MICROACTION_ARG_INDEX.get(arg)
+    if code is None and len(MICROACTION_ARGS) < _MAX_MICROACTION_ARGS:
+        code = len(MICROACTION_ARGS)
+        arg = sys.intern(arg)
+        _MICROACTION_ARG_INDEX[arg] = code
+        MICROACTION_ARGS.append(arg)
+    return code
 
-@dataclass
+
+def encode_microaction(label: str) -> Tuple[int, int]:
+    """
+    Split a micro-action label into (verb, arg) codes.
+    Labels with an unknown verb, or whose argument no longer fits the table,
+    encode as (OTHER, 0) and are not registered.
+    """
+    codes = _MICROACTION_CODES.get(label)
+    if codes is None:
+        for verb, prefix in _VERB_PREFIXES:
+            if label == prefix:
+                codes = (verb, 0)
+                break
+            if label.startswith(prefix + "_") and len(label) > len(prefix) + 1:
+                arg = _microaction_arg_code(label[len(prefix) + 1:])
+                if arg is None:
+                    return _OTHER_CODES
+                codes = (verb, arg)
+                break
+        else:
+            return _OTHER_CODES
+        _MICROACTION_CODES[label] = codes
+    return codes
+
+
+def decode_microaction(verb: int, arg: int) -> str:
+    """Rebuild the label from (verb, arg) codes. OTHER carries no label and raises ValueError."""
+    if verb == MicroActionVerb.OTHER:
+        raise ValueError("OTHER micro-actions are not encoded; keep detected_microaction")
+    prefix = _VERB_PREFIXES[verb - 1][1]
+    return f"{prefix}_{MICROACTION_ARGS[arg]}" if arg else prefix
+
+
+@dataclass(slots=True)
 class Observation:
     """
     Discrete observation of human behavior.
@@ -43,13 +136,181 @@ class Observation:
     spatial_context: SpatialContext
     action_context: ActionContext
     confidence: float = 1.0  # ROS might have < 1.0, Mesa always 1.0
+    # Integer codes of detected_microaction, for dispatch without string matching
+    verb: int = field(init=False, repr=False, compare=False)  # MicroActionVerb
+    arg: int = field(init=False, repr=False, compare=False)  # index into MICROACTION_ARGS (0 for OTHER)
+
+    def __post_init__(self):
+        # IDs are used as dict keys throughout; interned keys hit the identity fast path
+        self.agent_id = sys.intern(self.agent_id)
+        self.verb, self.arg = encode_microaction(self.detected_microaction)
+
+    @property
+    def microaction_code(self) -> int:
+        """verb and arg packed into one uint32 (verb << 16 | arg)."""
+        return self.verb << 16 | self.arg
+
+
+@dataclass(slots=True)
+class ObservationBatch:
+    """
+    Columnar (structure-of-arrays) storage for a stream of Observations.
+    String fields are stored as int32 codes into `labels` (-1 = None), except
+    micro-actions, which use the packed verb/arg code; OTHER micro-actions
+    (no arg code) also keep their label in `other_codes`.
+    ActionContext.metadata is not carried over.
+    """
+    timestamps: np.ndarray  # (N,) float64
+    positions: np.ndarray  # (N, 2) float32
+    orientations: np.ndarray  # (N,) float32
+    confidences: np.ndarray  # (N,) float32
+    progress: np.ndarray  # (N,) float32
+    agent_codes: np.ndarray  # (N,) int32
+    microaction_codes: np.ndarray  # (N,) uint32, Observation.microaction_code
+    zone_codes: np.ndarray  # (N,) int32
+    target_codes: np.ndarray  # (N,) int32
+    other_codes: np.ndarray  # (N,) int32, detected_microaction of OTHER rows, else -1
+    labels: List[str] = field(default_factory=list)  # string table for all *_codes columns
+
+    @classmethod
+    def from_observations(cls, observations: List[Observation]) -> "ObservationBatch":
+        """Pack a list of Observations into columns."""
+        labels: List[str] = []
+        index: Dict[str, int] = {}
+
+        def code(label: Optional[str]) -> int:
+            if label is None:
+                return -1
+            i = index.get(label)
+            if i is None:
+                label = sys.intern(label)
+                i = index[label] = len(labels)
+                labels.append(label)
+            return i
+
+        n = len(observations)
+        return cls(
+            timestamps=np.fromiter((o.timestamp for o in observations), np.float64, n),
+            positions=np.array([o.spatial_context.position for o in observations],
+                               dtype=np.float32).reshape(n, 2),
+            orientations=np.fromiter((o.spatial_context.orientation for o in observations), np.float32, n),
+            confidences=np.fromiter((o.confidence for o in observations), np.float32, n),
+            progress=np.fromiter((o.action_context.progress for o in observations), np.float32, n),
+            agent_codes=np.fromiter((code(o.agent_id) for o in observations), np.int32, n),
+            microaction_codes=np.fromiter((o.microaction_code for o in observations), np.uint32, n),
+            zone_codes=np.fromiter((code(o.spatial_context.zone) for o in observations), np.int32, n),
+            target_codes=np.fromiter((code(o.action_context.target_object) for o in observations), np.int32, n),
+            other_codes=np.fromiter(
+                (code(o.detected_microaction) if o.verb == MicroActionVerb.OTHER else -1 for o in observations),
+                np.int32, n),
+            labels=labels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _label(self, code: int) -> Optional[str]:
+        return self.labels[code] if code >= 0 else None
+
+    def __getitem__(self, i: int) -> Observation:
+        """Materialise row i as an Observation (for code that expects one)."""
+        x, y = self.positions[i]
+        other = self.other_codes[i]
+        if other >= 0:
+            microaction = self.labels[other]
+        else:
+            microaction = decode_microaction(*divmod(int(self.microaction_codes[i]), 1 << 16))
+        return Observation(
+            timestamp=float(self.timestamps[i]),
+            agent_id=self.labels[self.agent_codes[i]],
+            detected_microaction=microaction,
+            spatial_context=SpatialContext(
+                position=(float(x), float(y)),
+                orientation=float(self.orientations[i]),
+                zone=self._label(self.zone_codes[i]),
+            ),
+            action_context=ActionContext(
+                target_object=self._label(self.target_codes[i]),
+                progress=float(self.progress[i]),
+            ),
+            confidence=float(self.confidences[i]),
+        )
+
+
+@dataclass(slots=True)
+class ZoneBounds:
+    """
+    Zone rectangles from the domain config, as arrays for vectorized lookup.
+    Bounds are half-open (x_min <= x < x_max, y_min <= y < y_max), except
+    that the outermost x_max / y_max are inclusive, so points on the far
+    edge of the environment (e.g. x == 1600) still get a zone.
+    """
+    zone_ids: List[str]
+    x_min: np.ndarray  # (Z,)
+    x_max: np.ndarray
+    y_min: np.ndarray
+    y_max: np.ndarray
+
+    @classmethod
+    def from_domain(cls, zones: List[Dict[str, Any]]) -> "ZoneBounds":
+        """Build from the `zones` list of a domain config."""
+        def column(key: str) -> np.ndarray:
+            return np.array([z['bounds'][key] for z in zones], dtype=np.float32)
+        return cls(
+            zone_ids=[z['id'] for z in zones],
+            x_min=column('x_min'),
+            x_max=column('x_max'),
+            y_min=column('y_min'),
+            y_max=column('y_max'),
+        )
+
+
+def assign_zones(points: np.ndarray, bounds: ZoneBounds) -> np.ndarray:
+    """
+    Zone index (into bounds.zone_ids) for each point of an (N, 2) array.
+    Points outside every zone (or with no zones at all) get -1; overlapping
+    zones resolve to the first.
+    """
+    if not bounds.zone_ids:
+        return np.full(len(points), -1, dtype=np.intp)
+    x = points[:, 0, None]
+    y = points[:, 1, None]
+    x_below_max = (x < bounds.x_max) | ((x == bounds.x_max) & (bounds.x_max == bounds.x_max.max()))
+    y_below_max = (y < bounds.y_max) | ((y == bounds.y_max) & (bounds.y_max == bounds.y_max.max()))
+    mask = (x >= bounds.x_min) & x_below_max & (y >= bounds.y_min) & y_below_max
+    zone_idx = mask.argmax(axis=1)
+    zone_idx[~mask.any(axis=1)] = -1
+    return zone_idx
 
 
 # =============================================================================
 # BELIEF STATE TYPES
 # =============================================================================
 
-@dataclass
+# Fixed position of each intention in BeliefState.distribution.
+# Populated once from the task schemas (register_intentions) before beliefs are built.
+INTENTION_IDS: List[str] = []
+INTENTION_INDEX: Dict[str, int] = {}
+
+
+def register_intentions(intention_ids: Iterable[str]) -> None:
+    """Append intentions to the index; already-registered ids keep their position."""
+    for intention_id in intention_ids:
+        if intention_id not in INTENTION_INDEX:
+            intention_id = sys.intern(intention_id)
+            INTENTION_INDEX[intention_id] = len(INTENTION_IDS)
+            INTENTION_IDS.append(intention_id)
+
+
+def distribution_from_dict(probabilities: Dict[str, float]) -> np.ndarray:
+    """Build a distribution array from {intention_id: probability}; missing ids get 0."""
+    distribution = np.zeros(len(INTENTION_IDS), dtype=np.float32)
+    for intention_id, p in probabilities.items():
+        distribution[INTENTION_INDEX[intention_id]] = p
+    return distribution
+
+
+@dataclass(slots=True)
 class BeliefState:
     """
     Robot's belief distribution over human intentions.
@@ -57,37 +318,337 @@ class BeliefState:
     """
     timestamp: float
     agent_id: str
-    distribution: Dict[str, float]  # {intention_id: probability}
-    most_likely: str  # intention_id with highest probability
+    distribution: np.ndarray  # (len(INTENTION_IDS),) float32, indexed by INTENTION_INDEX
     confidence: float  # overall confidence in belief
-    predicted_next_actions: Dict[str, List[str]] = field(default_factory=dict)  # {intention_id: [action_types]}
+    # {intention_id: (action_types, ...)}; tuples, e.g. TaskSchema.decomposition shared as-is
+    predicted_next_actions: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    def __post_init__(self):
+        self.agent_id = sys.intern(self.agent_id)
+
+    @property
+    def most_likely(self) -> str:
+        """intention_id with highest probability"""
+        return INTENTION_IDS[int(self.distribution.argmax())]
+
+    def as_dict(self) -> Dict[str, float]:
+        """Distribution as {intention_id: probability}."""
+        return dict(zip(INTENTION_IDS, self.distribution.tolist()))
 
 
 # =============================================================================
 # WORLD STATE TYPES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """Symbolic state of a single agent."""
     agent_id: str
     current_zone: str
     holding: Optional[str] = None  # item_id or None
     current_task: Optional[str] = None  # task_id or None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.agent_id = sys.intern(self.agent_id)
+        self.current_zone = sys.intern(self.current_zone)
+
+
+def _check_agent_key(agent_id: str, state: Union[AgentState, "AgentView"]) -> None:
+    if state.agent_id != agent_id:
+        raise ValueError(f"key {agent_id!r} does not match agent_id {state.agent_id!r}")
+
+
+def _code_column(name: str, optional: bool = True) -> property:
+    """AgentView attribute backed by the AgentTable code column `name`."""
+    buffer = '_' + name
+
+    def get(self) -> Optional[str]:
+        return self._table._label(getattr(self._table, buffer)[self._row])
 
+    def set(self, value: Optional[str]) -> None:
+        if value is None and not optional:
+            raise ValueError(f"{name} cannot be None")
+        getattr(self._table, buffer)[self._row] = self._table._code(value)
 
-@dataclass
+    return property(get, set)
+
+
+class AgentView:
+    """
+    Live view of one AgentTable row, with the attributes of AgentState.
+    Reads and writes go straight to the table, so
+    `world.agent_states['h1'].holding = 'item_1'` updates the world state.
+    """
+    __slots__ = ('_table', 'agent_id')
+
+    def __init__(self, table: "AgentTable", agent_id: str):
+        self._table = table
+        self.agent_id = agent_id
+
+    @property
+    def _row(self) -> int:
+        # Resolved per access so views stay valid when other rows are deleted
+        return self._table._rows[self.agent_id]
+
+    current_zone = _code_column('current_zone', optional=False)
+    holding = _code_column('holding')
+    current_task = _code_column('current_task')
+
+    @property
+    def metadata(self) -> Optional[Dict[str, Any]]:
+        return self._table.agent_metadata.get(self._row)
+
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        if value is None:
+            self._table.agent_metadata.pop(self._row, None)
+        else:
+            self._table.agent_metadata[self._row] = value
+
+    def to_state(self) -> AgentState:
+        """Detached AgentState copy of the current row."""
+        return AgentState(self.agent_id, self.current_zone, self.holding, self.current_task, self.metadata)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (AgentView, AgentState)):
+            return NotImplemented
+        return (self.agent_id, self.current_zone, self.holding, self.current_task, self.metadata) == \
+            (other.agent_id, other.current_zone, other.holding, other.current_task, other.metadata)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"AgentView(agent_id={self.agent_id!r}, current_zone={self.current_zone!r}, "
+                f"holding={self.holding!r}, current_task={self.current_task!r}, metadata={self.metadata!r})")
+
+
+def _grown(column: np.ndarray, capacity: int, dtype: Any = None) -> np.ndarray:
+    """Copy of column in a larger buffer (unused slots are 0 / '')."""
+    grown = np.zeros(capacity, dtype=dtype or column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
+def _column_property(name: str) -> property:
+    """AgentTable column: the first len(table) entries of its buffer `_<name>`."""
+    buffer = '_' + name
+
+    def get(self) -> np.ndarray:
+        return getattr(self, buffer)[:len(self._rows)]
+
+    def set(self, column: np.ndarray) -> None:
+        setattr(self, buffer, column)
+
+    return property(get, set)
+
+
+class AgentTable(MutableMapping[str, AgentView]):
+    """
+    Columnar (structure-of-arrays) store of agent states for large crowds.
+    Zone/item/task strings are int32 codes into `labels` (-1 = None), so
+    queries such as agents_holding() are a single NumPy comparison.
+    Behaves as a mutable {agent_id: state} mapping: items are AgentViews that
+    write through to the columns, and assigning an AgentState inserts/overwrites
+    its row.
+
+    Columns sit in buffers that double when full, so adding agents one at a
+    time is amortised O(1); from_states() builds a whole table in one go.
+    Not a dataclass: use AgentView.to_state() (or WorldState.agent_states
+    items) to serialise, not dataclasses.asdict().
+    """
+    __slots__ = ('_agent_ids', '_current_zone', '_holding', '_current_task',
+                 'labels', 'agent_metadata', '_rows', '_codes')
+
+    agent_ids = _column_property('agent_ids')  # (N,) str
+    current_zone = _column_property('current_zone')  # (N,) int32
+    holding = _column_property('holding')  # (N,) int32, -1 = None
+    current_task = _column_property('current_task')  # (N,) int32, -1 = None
+
+    def __init__(
+        self,
+        agent_ids: Optional[np.ndarray] = None,
+        current_zone: Optional[np.ndarray] = None,
+        holding: Optional[np.ndarray] = None,
+        current_task: Optional[np.ndarray] = None,
+        labels: Optional[List[str]] = None,  # string table for the code columns
+        agent_metadata: Optional[Dict[int, Dict[str, Any]]] = None,  # row -> metadata, only if set
+    ):
+        self._agent_ids = np.empty(0, dtype=np.str_) if agent_ids is None else agent_ids
+        self._current_zone = np.empty(0, dtype=np.int32) if current_zone is None else current_zone
+        self._holding = np.empty(0, dtype=np.int32) if holding is None else holding
+        self._current_task = np.empty(0, dtype=np.int32) if current_task is None else current_task
+        self.labels = [] if labels is None else labels
+        self.agent_metadata = {} if agent_metadata is None else agent_metadata
+        self._rows = {sys.intern(str(agent_id)): i for i, agent_id in enumerate(self._agent_ids)}  # agent_id -> row
+        self._codes = {label: i for i, label in enumerate(self.labels)}  # label -> code
+
+    @classmethod
+    def from_states(cls, states: Iterable[AgentState]) -> "AgentTable":
+        """Build a table from AgentStates (e.g. the values of an {agent_id: AgentState} dict)."""
+        states = list(states)
+        n = len(states)
+        table = cls()
+        table._rows = {s.agent_id: i for i, s in enumerate(states)}
+        if len(table._rows) != n:
+            raise ValueError("duplicate agent_id in states")
+        table.agent_ids = np.array([s.agent_id for s in states], dtype=np.str_)
+        table.current_zone = np.fromiter((table._code(s.current_zone) for s in states), np.int32, n)
+        table.holding = np.fromiter((table._code(s.holding) for s in states), np.int32, n)
+        table.current_task = np.fromiter((table._code(s.current_task) for s in states), np.int32, n)
+        table.agent_metadata = {i: s.metadata for i, s in enumerate(states) if s.metadata is not None}
+        return table
+
+    @classmethod
+    def from_mapping(cls, states: Mapping[str, AgentState]) -> "AgentTable":
+        """from_states() for an {agent_id: AgentState} dict, checking each key matches its agent_id."""
+        for agent_id, state in states.items():
+            _check_agent_key(agent_id, state)
+        return cls.from_states(states.values())
+
+    def _code(self, label: Optional[str]) -> int:
+        if label is None:
+            return -1
+        code = self._codes.get(label)
+        if code is None:
+            label = sys.intern(label)
+            code = self._codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def _label(self, code: int) -> Optional[str]:
+        return self.labels[code] if code >= 0 else None
+
+    def __getitem__(self, agent_id: str) -> AgentView:
+        if agent_id not in self._rows:
+            raise KeyError(agent_id)
+        return AgentView(self, agent_id)
+
+    def __setitem__(self, agent_id: str, state: Union[AgentState, AgentView]) -> None:
+        _check_agent_key(agent_id, state)
+        self.set(state)
+
+    def __delitem__(self, agent_id: str) -> None:
+        row = self._rows.pop(agent_id)
+        n = len(self._rows)
+        # Shift the rows after it down by one in place (buffers keep their capacity)
+        for column in (self._agent_ids, self._current_zone, self._holding, self._current_task):
+            column[row:n] = column[row + 1:n + 1]
+        for other_id, other_row in self._rows.items():
+            if other_row > row:
+                self._rows[other_id] = other_row - 1
+        self.agent_metadata = {
+            r - (r > row): meta for r, meta in self.agent_metadata.items() if r != row
+        }
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"AgentTable({[self[agent_id] for agent_id in self._rows]!r})"
+
+    def _append_row(self, agent_id: str) -> int:
+        row = len(self._rows)
+        capacity = len(self._current_zone)
+        id_dtype = np.result_type(self._agent_ids.dtype, np.array(agent_id).dtype)
+        if row == capacity or id_dtype != self._agent_ids.dtype:
+            if row == capacity:
+                capacity = max(8, 2 * capacity)
+            self._agent_ids = _grown(self._agent_ids[:row], capacity, id_dtype)
+            self._current_zone = _grown(self._current_zone[:row], capacity)
+            self._holding = _grown(self._holding[:row], capacity)
+            self._current_task = _grown(self._current_task[:row], capacity)
+        self._agent_ids[row] = agent_id
+        self._rows[sys.intern(agent_id)] = row
+        return row
+
+    def set(self, state: Union[AgentState, AgentView]) -> None:
+        """Insert or overwrite the row for state.agent_id."""
+        if state.current_zone is None:
+            raise ValueError("current_zone cannot be None")
+        row = self._rows.get(state.agent_id)
+        if row is None:
+            row = self._append_row(state.agent_id)
+        self._current_zone[row] = self._code(state.current_zone)
+        self._holding[row] = self._code(state.holding)
+        self._current_task[row] = self._code(state.current_task)
+        if state.metadata is not None:
+            self.agent_metadata[row] = state.metadata
+        else:
+            self.agent_metadata.pop(row, None)
+
+    def _select(self, column: np.ndarray, label: str) -> np.ndarray:
+        code = self._codes.get(label)
+        if code is None:
+            return self.agent_ids[:0]
+        return self.agent_ids[column == code]
+
+    def agents_in_zone(self, zone_id: str) -> np.ndarray:
+        """IDs of agents whose current_zone is zone_id."""
+        return self._select(self.current_zone, zone_id)
+
+    def agents_holding(self, item_id: str) -> np.ndarray:
+        """IDs of agents holding item_id."""
+        return self._select(self.holding, item_id)
+
+
+# Known symbolic predicates; each owns one bit of WorldState.predicates.
+# Extend with register_predicates() (Python ints are unbounded, so no 64 limit).
+# Unregistered names raise KeyError everywhere, so typos surface immediately.
+KNOWN_PREDICATES: List[str] = ["path_clear", "human_at_table", "robot_at_shelf", "human_moving_north"]
+PREDICATE_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(KNOWN_PREDICATES)}
+
+
+def predicate_mask(names: Iterable[str]) -> int:
+    """Bitmask with the bits of all given predicate names set."""
+    mask = 0
+    for name in names:
+        mask |= PREDICATE_BITS[name]
+    return mask
+
+
+def register_predicates(names: Iterable[str]) -> None:
+    """Append predicates to the vocabulary; already-known names keep their bit."""
+    for name in names:
+        if name not in PREDICATE_BITS:
+            name = sys.intern(name)
+            PREDICATE_BITS[name] = 1 << len(KNOWN_PREDICATES)
+            KNOWN_PREDICATES.append(name)
+
+
+@dataclass(slots=True)
 class WorldState:
     """
     Symbolic representation of the environment.
     Built by embodiment layers, consumed by cognitive layer.
     """
     timestamp: float
-    agent_states: Dict[str, AgentState]  # {agent_id: AgentState}
+    agent_states: AgentTable  # mutable {agent_id: AgentView}; a dict of AgentStates is converted
     object_locations: Dict[str, str]  # {object_id: location_id}
-    predicates: Set[str] = field(default_factory=set)  # e.g., "path_clear", "human_at_table"
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    predicates: int = 0  # bitmask over PREDICATE_BITS; an iterable of names is converted
+    metadata: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        if not isinstance(self.agent_states, AgentTable):
+            self.agent_states = AgentTable.from_mapping(self.agent_states)
+        if not isinstance(self.predicates, int):
+            self.predicates = predicate_mask(self.predicates)
+
+    def add_predicate(self, name: str) -> None:
+        self.predicates |= PREDICATE_BITS[name]
+
+    def discard_predicate(self, name: str) -> None:
+        self.predicates &= ~PREDICATE_BITS[name]
+
+    def has_predicate(self, name: str) -> bool:
+        return bool(self.predicates & PREDICATE_BITS[name])
+
+    def predicates_as_set(self) -> Set[str]:
+        """Predicate names that are set (for debugging/logging)."""
+        return {name for name, bit in PREDICATE_BITS.items() if self.predicates & bit}
 
 
 # =============================================================================
@@ -103,23 +664,29 @@ class ActionType(Enum):
     HANDOVER = "handover"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbstractAction:
     """
     High-level action with optional execution hints.
     The planner outputs these; embodiment layers interpret them.
+    Hashable, so it can key caches (e.g. functools.lru_cache on action costs).
     """
     action_type: ActionType
-    parameters: Dict[str, Any]  # e.g., {"target": "shelf_3", "item": "item_7"}
+    parameters: Params  # e.g., (("item", "item_7"), ("target", "shelf_3")); a dict is converted
     
     # Optional execution hints (Mesa may use directly, ROS may ignore)
-    estimated_path: Optional[List[Tuple[float, float]]] = None
+    estimated_path: Optional[Tuple[Tuple[float, float], ...]] = None
     estimated_duration: float = 0.0
-    spatial_constraints: Dict[str, Any] = field(default_factory=dict)
-    temporal_constraints: Dict[str, Any] = field(default_factory=dict)
+    spatial_constraints: Optional[Dict[str, Any]] = field(default=None, compare=False)
+    temporal_constraints: Optional[Dict[str, Any]] = field(default=None, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, 'parameters', _freeze_params(self.parameters))
+        if self.estimated_path is not None:
+            object.__setattr__(self, 'estimated_path', tuple(map(tuple, self.estimated_path)))
 
-@dataclass
+
+@dataclass(slots=True)
 class AbstractPlan:
     """
     Complete plan for robot execution.
@@ -128,28 +695,32 @@ class AbstractPlan:
     goal_intention: str  # What robot is trying to achieve
     actions: List[AbstractAction]
     estimated_total_cost: float = 0.0
-    contingencies: Dict[str, Any] = field(default_factory=dict)  # Future: alternative plans
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    contingencies: Optional[Dict[str, Any]] = None  # Future: alternative plans
+    metadata: Optional[Dict[str, Any]] = None
 
 
 # =============================================================================
 # TASK KNOWLEDGE TYPES (for configs and knowledge.py)
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskSchema:
     """
     Schema for a task type (e.g., DELIVER_ITEM, COFFEE_BREAK).
     Instantiated with specific parameters at runtime.
     """
     task_id: str  # e.g., "DELIVER_ITEM", "COFFEE_BREAK"
-    parameters: List[str]  # e.g., ["item"], []
-    decomposition: List[str]  # Action type IDs that comprise this task
+    parameters: Tuple[str, ...]  # e.g., ("item",), (); a list is converted
+    decomposition: Tuple[str, ...]  # Action type IDs that comprise this task
     is_foreseeable: bool = False  # True for human behaviors like COFFEE_BREAK
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'parameters', tuple(self.parameters))
+        object.__setattr__(self, 'decomposition', tuple(self.decomposition))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskInstance:
     """
     Concrete instantiation of a TaskSchema.
@@ -157,5 +728,8 @@ class TaskInstance:
     """
     schema_id: str  # Links to TaskSchema.task_id
     instance_id: str  # Unique identifier for this instance
-    parameters: Dict[str, Any]  # e.g., {"item": "item_7"}
-    metadata: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    parameters: Params  # e.g., (("item", "item_7"),); a dict is converted
+    metadata: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'parameters', _freeze_params(self.parameters))
\ No newline at end of file
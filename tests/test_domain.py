@@ -0,0 +1,78 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from domain_assembler import convert_gazebo_to_domain
+from shared.domain import get_entity, load_domain
+
+
+def _hand_edit(path, edit):
+    with open(path) as f:
+        domain = yaml.safe_load(f)
+    edit(domain)
+    with open(path, 'w') as f:
+        yaml.safe_dump(domain, f, sort_keys=False)
+
+
+def test_yaml_and_json_outputs_keep_separate_caches(tmp_path):
+    yaml_path = tmp_path / 'domain.yaml'
+    convert_gazebo_to_domain(output_path=yaml_path)
+    _hand_edit(yaml_path, lambda d: d['metadata'].update(name='hand_edited'))
+
+    # Regenerating the JSON variant must not shadow the hand-edited YAML
+    convert_gazebo_to_domain(output_path=tmp_path / 'domain.json')
+
+    assert load_domain(yaml_path)['metadata']['name'] == 'hand_edited'
+    assert load_domain(tmp_path / 'domain.json')['metadata']['name'] == 'test_kitting_cell'
+
+
+def test_hand_edit_with_unchanged_mtime_bypasses_cache(tmp_path):
+    yaml_path = tmp_path / 'domain.yaml'
+    convert_gazebo_to_domain(output_path=yaml_path)
+    generated_ns = yaml_path.stat().st_mtime_ns
+    _hand_edit(yaml_path, lambda d: d['metadata'].update(name='hand_edited'))
+    # As on a coarse-timestamp filesystem: the edit lands in the same tick
+    os.utime(yaml_path, ns=(generated_ns, generated_ns))
+
+    assert load_domain(yaml_path)['metadata']['name'] == 'hand_edited'
+
+
+def test_get_entity_survives_hand_reordered_list(tmp_path):
+    yaml_path = tmp_path / 'domain.yaml'
+    convert_gazebo_to_domain(output_path=yaml_path)
+    _hand_edit(yaml_path, lambda d: d['shelves'].reverse())
+
+    domain = load_domain(yaml_path)
+    for shelf_id in ('shelf_1', 'shelf_2', 'shelf_3'):
+        assert get_entity(domain, 'shelves', shelf_id)['id'] == shelf_id
+    with pytest.raises(KeyError):
+        get_entity(domain, 'shelves', 'shelf_9')
+
+
+def test_relative_output_dir_is_created_in_each_working_dir(tmp_path, monkeypatch):
+    for run in ('first', 'second'):
+        workdir = tmp_path / run
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        convert_gazebo_to_domain(output_path='out/domain.yaml')
+        assert (workdir / 'out' / 'domain.yaml').exists()
+
+
+def test_load_domain_is_memoized_until_the_file_changes(tmp_path, monkeypatch):
+    yaml_path = tmp_path / 'domain.yaml'
+    convert_gazebo_to_domain(output_path=yaml_path)
+    first = load_domain(yaml_path)
+    monkeypatch.chdir(tmp_path)
+    assert load_domain('domain.yaml') is first
+
+    _hand_edit(yaml_path, lambda d: d['metadata'].update(name='hand_edited'))
+    mtime_ns = yaml_path.stat().st_mtime_ns
+    os.utime(yaml_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    reloaded = load_domain(yaml_path)
+    assert reloaded is not first
+    assert reloaded['metadata']['name'] == 'hand_edited'
@@ -0,0 +1,56 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from domain_assembler import build_indexes, generate_test_domain, write_domain_yaml
+
+
+def _round_trip(domain):
+    f = io.StringIO()
+    write_domain_yaml(domain, f)
+    return yaml.safe_load(f.getvalue())
+
+
+def test_write_domain_yaml_round_trips_test_domain():
+    domain = generate_test_domain()
+    domain['_indexes'] = build_indexes(domain)
+    assert _round_trip(domain) == domain
+
+
+@pytest.mark.parametrize('domain', [
+    {'1': 2, 'yes': 1, 'null': 'no', 'on': 'off'},
+    {'floats': [1e-05, 1e+20, -2.5e-300, 0.1, 3.0, -0.0]},
+    {'f': 1e-05, 'g': 1e+20, 'h': 12345678.9},
+    {'mixed': [True, False, None, 0, '', 'a: b', '#x', '- y']},
+    {'nested': [{'id': 'a', 'bounds': {'x': 1.5}}, {'id': '2'}], 'empty': {}, 'none': []},
+    {'matrix': [[1, 2], [3.5, 'x']], 'inline': [{'k': 1}]},
+    {'unicode': 'zöne ✓', 'quote': 'say "hi"\n'},
+])
+def test_write_domain_yaml_round_trips_edge_cases(domain):
+    assert _round_trip(domain) == domain
+
+
+@pytest.mark.parametrize('value', [float('inf'), float('-inf'), float('nan')])
+def test_write_domain_yaml_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        write_domain_yaml({'x': value}, io.StringIO())
+
+
+@pytest.mark.parametrize('args', [
+    ['--emit', 'py', '--output', 'domain.yaml'],
+    ['--emit', 'yaml', '--output', 'domain.json'],
+    ['--fast-yaml', '--emit', 'json'],
+    ['--fast-yaml', '--output', 'domain.py'],
+])
+def test_cli_rejects_conflicting_format_options(tmp_path, args):
+    script = Path(__file__).resolve().parent.parent / 'scripts' / 'domain_assembler.py'
+    result = subprocess.run([sys.executable, str(script), *args], cwd=tmp_path,
+                            capture_output=True, text=True)
+    assert result.returncode == 2
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from shared import recognizer, types
+from shared.recognizer import bayes_update, update_beliefs, update_beliefs_batch
+from shared.types import (ActionContext, BeliefState, Observation, SpatialContext,
+                          distribution_from_dict, register_intentions)
+
+
+@pytest.fixture(autouse=True)
+def _restore_intention_index():
+    # register_intentions mutates module globals; restore them in place so
+    # other references to the list/dict see the original contents again
+    ids, index = list(types.INTENTION_IDS), dict(types.INTENTION_INDEX)
+    yield
+    types.INTENTION_IDS[:] = ids
+    types.INTENTION_INDEX.clear()
+    types.INTENTION_INDEX.update(index)
+
+
+def _setup():
+    register_intentions(['A', 'B', 'C'])
+    likelihoods = {
+        'move_to_shelf_3': np.array([0.8, 0.1, 0.1]),  # float64, NumPy's default
+        'wait': np.array([0.1, 0.1, 0.8]),
+        'dance': np.zeros(3),
+    }
+    beliefs = {
+        f'h{i}': BeliefState(0.0, f'h{i}', distribution_from_dict({'A': 0.5, 'B': 0.3, 'C': 0.2}), 0.5)
+        for i in range(6)
+    }
+    observations = [
+        Observation(1.0, f'h{i}', ['wait', 'move_to_shelf_3', 'dance'][i % 3],
+                    SpatialContext((0.0, 0.0), 0.0), ActionContext())
+        for i in range(5)
+    ]
+    return (lambda obs: likelihoods[obs.detected_microaction]), beliefs, observations
+
+
+def test_bayes_update_keeps_float32_with_float64_likelihood():
+    likelihood, beliefs, observations = _setup()
+    posterior = bayes_update(beliefs['h1'], observations[1], likelihood)
+    assert posterior.distribution.dtype == np.float32
+    assert posterior.most_likely == 'A'
+    # Zero likelihood everywhere keeps the prior
+    assert bayes_update(beliefs['h2'], observations[2], likelihood).distribution.dtype == np.float32
+
+
+@pytest.fixture(params=['_update_kernel_numpy', '_update_kernel'])
+def kernel(request, monkeypatch):
+    # Run update_beliefs_batch with each kernel (identical if numba is missing)
+    monkeypatch.setattr(recognizer, '_update_kernel', getattr(recognizer, request.param))
+
+
+@pytest.mark.usefixtures('kernel')
+def test_batch_update_matches_per_agent_update():
+    likelihood, beliefs, observations = _setup()
+    batched = update_beliefs_batch(observations, beliefs, likelihood)
+    serial = update_beliefs(observations, beliefs, likelihood)
+    for obs in observations:
+        np.testing.assert_allclose(batched[obs.agent_id].distribution,
+                                   serial[obs.agent_id].distribution, rtol=1e-6)
+    assert batched['h5'] is beliefs['h5'] and serial['h5'] is beliefs['h5']
+
+
+@pytest.mark.usefixtures('kernel')
+def test_beliefs_built_before_new_intentions_are_padded():
+    _, beliefs, observations = _setup()
+    register_intentions(['D'])
+    padded = {
+        'move_to_shelf_3': np.array([0.8, 0.1, 0.1, 0.5]),
+        'wait': np.array([0.1, 0.1, 0.8, 0.5]),
+        'dance': np.zeros(4),
+    }
+    def likelihood(obs):
+        return padded[obs.detected_microaction]
+
+    batched = update_beliefs_batch(observations, beliefs, likelihood)
+    serial = update_beliefs(observations, beliefs, likelihood)
+    for obs in observations:
+        assert batched[obs.agent_id].distribution.shape == (4,)
+        assert batched[obs.agent_id].distribution[3] == 0  # new intention starts at prior 0
+        np.testing.assert_allclose(batched[obs.agent_id].distribution,
+                                   serial[obs.agent_id].distribution, rtol=1e-6)
@@ -0,0 +1,201 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+import shared.types as types
+from shared.types import (
+    ActionContext,
+    AgentState,
+    AgentTable,
+    MicroActionVerb,
+    Observation,
+    ObservationBatch,
+    SpatialContext,
+    WorldState,
+    ZoneBounds,
+    assign_zones,
+    decode_microaction,
+    encode_microaction,
+)
+
+
+def _observation(microaction, zone="zone_SW", target=None):
+    return Observation(
+        timestamp=1.5,
+        agent_id="h1",
+        detected_microaction=microaction,
+        spatial_context=SpatialContext(position=(100.0, 250.5), orientation=0.5, zone=zone),
+        action_context=ActionContext(target_object=target, progress=0.25),
+        confidence=0.75,  # exact in float32, so batch round-trips compare equal
+    )
+
+
+def test_world_state_converts_predicate_names_to_bitmask():
+    world = WorldState(0.0, {}, {}, predicates={"path_clear", "human_at_table"})
+    assert isinstance(world.predicates, int)
+    assert world.has_predicate("path_clear")
+    assert not world.has_predicate("robot_at_shelf")
+    assert world.predicates_as_set() == {"path_clear", "human_at_table"}
+
+
+def test_unknown_predicate_raises_key_error():
+    world = WorldState(0.0, {}, {})
+    with pytest.raises(KeyError):
+        world.add_predicate("path_claer")
+    with pytest.raises(KeyError):
+        world.has_predicate("path_claer")
+    with pytest.raises(KeyError):
+        WorldState(0.0, {}, {}, predicates=["path_claer"])
+
+
+def test_agent_table_items_write_through():
+    world = WorldState(0.0, {"h1": AgentState("h1", "zone_SW")}, {})
+    world.agent_states["h1"].holding = "item_1"
+    assert world.agent_states["h1"].holding == "item_1"
+    assert list(world.agent_states.agents_holding("item_1")) == ["h1"]
+
+    agent = world.agent_states["h1"]
+    if agent.metadata is None:
+        agent.metadata = {}
+    agent.metadata["speed"] = 1.0
+    assert world.agent_states["h1"].metadata == {"speed": 1.0}
+
+
+def test_agent_table_setitem_and_delitem():
+    table = WorldState(0.0, {"h1": AgentState("h1", "zone_SW")}, {}).agent_states
+    table["h2"] = AgentState("h2", "zone_NE", current_task="DELIVER_ITEM")
+    view = table["h2"]
+    assert view == AgentState("h2", "zone_NE", current_task="DELIVER_ITEM")
+    with pytest.raises(ValueError):
+        table["h3"] = AgentState("h2", "zone_NE")
+
+    del table["h1"]
+    assert list(table) == ["h2"]
+    assert view.current_zone == "zone_NE"  # still points at h2 after the row shift
+    assert list(table.agents_in_zone("zone_NE")) == ["h2"]
+    with pytest.raises(KeyError):
+        table["h1"]
+
+
+def test_agent_view_rejects_none_zone():
+    table = WorldState(0.0, {"h1": AgentState("h1", "zone_SW")}, {}).agent_states
+    with pytest.raises(ValueError):
+        table["h1"].current_zone = None
+    assert table["h1"].to_state() == AgentState("h1", "zone_SW")
+
+
+def test_world_state_dict_keys_must_match_agent_ids():
+    with pytest.raises(ValueError):
+        WorldState(0.0, {"h1": AgentState("h2", "zone_SW")}, {})
+
+
+def test_agent_table_grows_one_agent_at_a_time():
+    table = WorldState(0.0, {}, {}).agent_states
+    ids = [f"agent_{i}" for i in range(100)] + ["a_much_longer_agent_id"]
+    for i, agent_id in enumerate(ids):
+        table[agent_id] = AgentState(agent_id, f"zone_{i % 2}", holding=f"item_{i}")
+    del table["agent_0"]
+
+    assert len(table) == len(table.agent_ids) == 100
+    assert list(table.agent_ids) == ids[1:]
+    assert table["a_much_longer_agent_id"].holding == "item_100"
+    assert len(table.agents_in_zone("zone_1")) == 50
+
+
+def test_asdict_does_not_expose_agent_table_internals():
+    world = WorldState(0.0, {"h1": AgentState("h1", "zone_SW")}, {})
+    agent_states = dataclasses.asdict(world)["agent_states"]
+    assert isinstance(agent_states, AgentTable)
+    assert agent_states["h1"] == AgentState("h1", "zone_SW")
+
+
+@pytest.mark.parametrize("label, verb", [
+    ("move_to_shelf_3", MicroActionVerb.MOVE_TO),
+    ("pick_item_7", MicroActionVerb.PICK),
+    ("wait", MicroActionVerb.WAIT),
+])
+def test_microaction_round_trip(label, verb):
+    codes = encode_microaction(label)
+    assert codes[0] == verb
+    assert decode_microaction(*codes) == label
+
+
+def test_unknown_verb_encodes_as_other_without_growing_vocabulary():
+    n_args = len(types.MICROACTION_ARGS)
+    assert encode_microaction("dance_wildly") == (MicroActionVerb.OTHER, 0)
+    assert encode_microaction("pick_") == (MicroActionVerb.OTHER, 0)
+    assert len(types.MICROACTION_ARGS) == n_args
+    assert "dance_wildly" not in types._MICROACTION_CODES
+    with pytest.raises(ValueError):
+        decode_microaction(MicroActionVerb.OTHER, 0)
+
+
+def test_full_arg_table_falls_back_to_other(monkeypatch):
+    monkeypatch.setattr(types, "_MAX_MICROACTION_ARGS", len(types.MICROACTION_ARGS))
+    assert encode_microaction("pick_item_never_seen_before") == (MicroActionVerb.OTHER, 0)
+
+
+def test_microaction_code_packs_verb_and_arg():
+    obs = _observation("place_item_9")
+    assert obs.microaction_code == obs.verb << 16 | obs.arg
+    assert divmod(obs.microaction_code, 1 << 16) == encode_microaction("place_item_9")
+
+
+def test_observation_batch_decodes_microactions():
+    observations = [_observation("handover_item_2"), _observation("dance_wildly")]
+    batch = ObservationBatch.from_observations(observations)
+    assert [batch[i].detected_microaction for i in range(len(batch))] == ["handover_item_2", "dance_wildly"]
+    assert batch[1].verb == MicroActionVerb.OTHER
+
+
+# 2x2 grid of the test domain (1600 x 800)
+_GRID_ZONES = [
+    {'id': 'zone_SE', 'bounds': {'x_min': 800, 'x_max': 1600, 'y_min': 0, 'y_max': 400}},
+    {'id': 'zone_SW', 'bounds': {'x_min': 0, 'x_max': 800, 'y_min': 0, 'y_max': 400}},
+    {'id': 'zone_NW', 'bounds': {'x_min': 0, 'x_max': 800, 'y_min': 400, 'y_max': 800}},
+    {'id': 'zone_NE', 'bounds': {'x_min': 800, 'x_max': 1600, 'y_min': 400, 'y_max': 800}},
+]
+
+
+@pytest.mark.parametrize("point, zone_id", [
+    ((100, 100), 'zone_SW'),
+    ((1400, 100), 'zone_SE'),
+    ((650, 710), 'zone_NW'),
+    ((1450, 770), 'zone_NE'),
+    ((0, 0), 'zone_SW'),  # min edges are inclusive
+    ((800, 400), 'zone_NE'),  # shared edges go to the zone starting there
+    ((1600, 800), 'zone_NE'),  # outer max edges are inclusive
+    ((1600, 0), 'zone_SE'),
+    ((0, 800), 'zone_NW'),
+    ((-1, 100), None),
+    ((1601, 100), None),
+    ((100, 800.5), None),
+])
+def test_assign_zones_grid(point, zone_id):
+    bounds = ZoneBounds.from_domain(_GRID_ZONES)
+    (zone_idx,) = assign_zones(np.array([point], dtype=np.float32), bounds)
+    assert (bounds.zone_ids[zone_idx] if zone_idx >= 0 else None) == zone_id
+
+
+def test_assign_zones_without_zones():
+    points = np.array([[100, 100], [1400, 700]], dtype=np.float32)
+    assert list(assign_zones(points, ZoneBounds.from_domain([]))) == [-1, -1]
+
+
+def test_observation_batch_round_trip():
+    observations = [
+        _observation("move_to_shelf_3", target="shelf_3"),
+        _observation("wait", zone=None, target=None),
+    ]
+    batch = ObservationBatch.from_observations(observations)
+    assert len(batch) == 2
+    assert batch.zone_codes[1] == -1 and batch.target_codes[1] == -1
+    assert [batch[i] for i in range(len(batch))] == observations
+
+
+def test_empty_observation_batch():
+    batch = ObservationBatch.from_observations([])
+    assert len(batch) == 0
+    assert batch.positions.shape == (0, 2)
+    assert batch.labels == []